@@ -11,11 +11,13 @@ from aws_cdk import (
     Duration,
     Stack,
     aws_lambda as _lambda,
-    aws_apigateway as apigateway,
+    aws_apigatewayv2 as apigwv2,
+    aws_apigatewayv2_integrations as apigwv2_integrations,
     aws_sns as sns,
+    aws_sns_subscriptions as sns_subscriptions,
+    aws_sqs as sqs,
     CfnOutput,
 )
-from aws_cdk import aws_sns_subscriptions as sns_subscriptions
 from constructs import Construct
 
 
@@ -25,15 +27,20 @@ class ChannelRouterStack(Stack):
     """
 
     # TODO: #11 Use FIFO SQS queues to ensure message ordering between the receiver and handler Lambdas.
+    # When adding them, enable FIFO high-throughput mode (deduplication_scope=MESSAGE_GROUP and
+    # fifo_throughput_limit=PER_MESSAGE_GROUP_ID) and use the channel name plus the chat id as the
+    # MessageGroupId, so ordering and deduplication are tracked per conversation instead of per queue.
 
     def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
         super().__init__(scope, construct_id, **kwargs)
 
-        # Create API Gateway to handle incoming webhooks from various channels
-        api_gateway = apigateway.RestApi(
+        # Create an HTTP API Gateway to handle incoming webhooks from various channels.
+        # The webhooks need no REST API-only features, and HTTP APIs have lower
+        # per-request latency and cost.
+        api_gateway = apigwv2.HttpApi(
             self,
             "ChannelRouterWebhookAPI",
-            rest_api_name="ChannelRouter Webhook API",
+            api_name="ChannelRouter Webhook API",
             description="API Gateway to receive webhooks from various channels.",
         )
 
@@ -43,39 +50,52 @@ class ChannelRouterStack(Stack):
             "AllChannelsReceiverLambda",
             runtime=_lambda.Runtime.PYTHON_3_11,
             handler="all_channels_receiver.handler",
-            code=_lambda.Code.from_asset("lambdas"),
+            # Ship only the code the receiver needs
+            code=_lambda.Code.from_asset(
+                "lambdas", exclude=["outgoing_messages_sender.py", "**/__pycache__"]
+            ),
             timeout=Duration.seconds(60),
+            # vCPU share and network bandwidth scale with memory; 1769 MB is one
+            # full vCPU, which keeps the SNS publish on the webhook's critical path
+            # as fast as possible
+            memory_size=1769,
         )
 
-        # Add a proxy resource to handle dynamic channel and bot routing
-        proxy_resource = api_gateway.root.add_resource("{proxy+}")
-
-        # Add POST method for handling webhook messages
-        proxy_resource.add_method(
-            "POST",
-            apigateway.LambdaIntegration(all_channels_receiver_lambda),
-            method_responses=[
-                {
-                    "statusCode": "200",
-                    "responseParameters": {
-                        "method.response.header.Access-Control-Allow-Origin": True
-                    },
-                }
-            ],
+        # Channels retry webhooks that answer slowly, so keep a few pre-initialized
+        # receiver instances behind a "live" alias to absorb concurrent bursts
+        # without cold starts. The API Gateway integrations target this alias.
+        # SnapStart is deliberately not used: Lambda does not allow it together with
+        # provisioned concurrency, and it is not available for the Python 3.11 runtime.
+        all_channels_receiver_alias = _lambda.Alias(
+            self,
+            "AllChannelsReceiverLiveAlias",
+            alias_name="live",
+            version=all_channels_receiver_lambda.current_version,
+            provisioned_concurrent_executions=5,
+        )
+
+        # A single integration with the receiver, shared by all routes.
+        # Payload format 1.0 keeps the event structure ("httpMethod",
+        # "pathParameters", ...) that AllChannelsReceiver parses.
+        all_channels_receiver_integration = apigwv2_integrations.HttpLambdaIntegration(
+            "AllChannelsReceiverIntegration",
+            all_channels_receiver_alias,
+            payload_format_version=apigwv2.PayloadFormatVersion.VERSION_1_0,
+        )
+
+        # Add a proxy route to handle dynamic channel and bot routing:
+        # POST for webhook messages and GET for webhook validation (for WhatsApp/Facebook)
+        api_gateway.add_routes(
+            path="/{proxy+}",
+            methods=[apigwv2.HttpMethod.POST, apigwv2.HttpMethod.GET],
+            integration=all_channels_receiver_integration,
         )
 
-        # Add GET method for webhook validation (for WhatsApp/Facebook)
-        proxy_resource.add_method(
-            "GET",
-            apigateway.LambdaIntegration(all_channels_receiver_lambda),
-            method_responses=[
-                {
-                    "statusCode": "200",
-                    "responseParameters": {
-                        "method.response.header.Access-Control-Allow-Origin": True
-                    },
-                }
-            ],
+        # Export the webhook base URL; channels are registered as <url><channel>/<app_token>
+        CfnOutput(
+            self,
+            "ChannelRouterWebhookAPIUrl",
+            value=api_gateway.url,
         )
 
         # AllChannelsReceiverLambda, after consuming and processing the incoming messages,
@@ -113,14 +133,27 @@ class ChannelRouterStack(Stack):
             topic_name="OutgoingMessagesTopic",
         )
 
+        # Outgoing messages that still fail after Lambda's asynchronous retries
+        # are kept in this queue instead of being discarded
+        outgoing_messages_dlq = sqs.Queue(
+            self,
+            "OutgoingMessagesDLQ",
+            retention_period=Duration.days(14),
+        )
+
         # Create a Lambda function to send outgoing messages to the appropriate channel
         outgoing_messages_sender_lambda = _lambda.Function(
             self,
             "OutgoingMessagesSenderLambda",
             runtime=_lambda.Runtime.PYTHON_3_11,
             handler="outgoing_messages_sender.handler",
-            code=_lambda.Code.from_asset("lambdas"),
+            # Ship only the code the sender needs
+            code=_lambda.Code.from_asset(
+                "lambdas", exclude=["all_channels_receiver.py", "**/__pycache__"]
+            ),
             timeout=Duration.seconds(60),
+            memory_size=512,
+            dead_letter_queue=outgoing_messages_dlq,
         )
 
         # Grant the outgoing messages sender Lambda permission to receive messages from the outgoing messages SNS topic
@@ -0,0 +1,15 @@
+"""
+This module adds the lambdas/packages directory to the system path.
+The Lambda entry points must import it before importing any modules from the
+packages directory.
+"""
+
+import os
+import sys
+
+_PACKAGES_DIR = os.path.join(os.path.dirname(__file__), "packages")
+
+# Appended (not inserted first) so the packages never shadow the function's own
+# modules or the boto3 provided by the Lambda runtime.
+if _PACKAGES_DIR not in sys.path:
+    sys.path.append(_PACKAGES_DIR)
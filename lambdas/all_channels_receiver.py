@@ -3,17 +3,37 @@ This module is the Lambda handler to process incoming Telegram messages.
 """
 
 import os
-import sys
 import json
 
-# Adds lambda/create/packages to the system path.
+# Adds lambdas/packages to the system path.
 # This must be done before importing any modules from the packages directory.
-sys.path.append(os.path.join(os.path.dirname(__file__), "packages"))
+import _bootstrap  # noqa: F401
 
+import boto3
+from botocore.config import Config
 from app_common.base_lambda_handler import BaseLambdaHandler
-from channels_config import CHANNELS_HANDLER_CLASS_MAP as HANDLERS_MAP
+from channels_config import get_channel_handler_class
 from channel_handler import ChannelHandler
 
+# Created once per execution environment and reused by every warm invocation,
+# so the TLS connection and the credentials are not set up again per message.
+# The publish is on the webhook's critical path, so keep connections alive,
+# bound the retries and skip the client-side validation of the request parameters.
+_SNS_CLIENT = boto3.client(
+    "sns",
+    config=Config(
+        retries={"mode": "standard", "max_attempts": 2},
+        tcp_keepalive=True,
+        parameter_validation=False,
+    ),
+)
+# Read once at init; a missing variable fails the cold start instead of every request
+_INCOMING_MSGS_SNS_TOPIC_ARN = os.environ["INCOMING_MSGS_SNS_TOPIC_ARN"]
+
+# Constant response bodies, serialized once instead of on every invocation
+_OK_RESPONSE_BODY = json.dumps({"status": "ok"})
+_METHOD_NOT_ALLOWED_RESPONSE_BODY = json.dumps({"error": "Method Not Allowed"})
+
 
 class AllChannelsReceiver(BaseLambdaHandler):
     """
@@ -24,17 +44,22 @@ class AllChannelsReceiver(BaseLambdaHandler):
         """
         Handle the incoming messages from all channels.
         """
-        # Extract app token and channel from the URL path
-        path_parameters = self.event["pathParameters"]["proxy"].split("/")
-        channel_name = path_parameters[0]  # e.g., "whatsapp"
-        app_token = path_parameters[1]  # e.g., "bot123"
+        # Extract app token and channel from the URL path,
+        # e.g., "whatsapp/bot123" -> "whatsapp", "bot123"
+        proxy_path = self.event["pathParameters"]["proxy"]
+        channel_name, _, app_token = proxy_path.partition("/")
 
         self.do_log(
             f"Received message from channel: {channel_name} with app token: {app_token}"
         )
 
+        if not app_token:
+            # Without the app token, no subscriber can route the message
+            self.do_log(f"No app token in the path: {proxy_path}")
+            return
+
         # Get the handler class for the channel
-        handler_class = HANDLERS_MAP.get(channel_name)
+        handler_class = get_channel_handler_class(channel_name)
         if not handler_class:
             self.do_log(f"Channel {channel_name} not supported.")
             return
@@ -42,18 +67,19 @@ class AllChannelsReceiver(BaseLambdaHandler):
         # Create the handler instance
         handler_instance: ChannelHandler = handler_class(self)
 
+        http_method = self.event["httpMethod"]
         # test if is a GET request
-        if self.event["httpMethod"] == "GET":
+        if http_method == "GET":
             return self._handle_get(handler_instance)
         # test if is a POST request
-        if self.event["httpMethod"] == "POST":
+        if http_method == "POST":
             return self._handle_post(handler_instance, app_token)
         # if it is not a GET or POST request, return an error
         self.do_log("Invalid request method.")
         return {
             "statusCode": 405,
             "headers": {"Content-Type": "application/json"},
-            "body": json.dumps({"error": "Method Not Allowed"}),
+            "body": _METHOD_NOT_ALLOWED_RESPONSE_BODY,
         }
 
     def _handle_get(self, handler_instance: ChannelHandler):
@@ -71,30 +97,23 @@ class AllChannelsReceiver(BaseLambdaHandler):
         """
         The main method to process incoming messages.
         """
-        # Get the message details from the handler
-        user_message = handler_instance.extract_user_txt_msg()
-        channel_user_firstname = handler_instance.extract_channel_user_firstname()
-        channel_user_id = handler_instance.extract_channel_user_id()
-        channel_chat_id = handler_instance.extract_channel_chat_id()
-        channel_msg_id = handler_instance.extract_channel_msg_id()
-        user_message_timestamp = handler_instance.extract_message_timestamp()
-
-        # Get the SNS topic ARN from the environment variable
-        sns_topic_arn = self.get_env_var("INCOMING_MSGS_SNS_TOPIC_ARN")
-        sns_message = json.dumps(
-            {
-                "app_token": app_token,
-                "channel": handler_instance.get_channel_name(),
-                "user_message": user_message,
-                "channel_user_firstname": channel_user_firstname,
-                "channel_user_id": channel_user_id,
-                "channel_chat_id": channel_chat_id,
-                "channel_msg_id": channel_msg_id,
-                "user_message_timestamp": user_message_timestamp,
-            }
-        )
-        # Forward the message to the SNS topic
-        self.publish_to_sns(topic_arn=sns_topic_arn, message=sns_message)
+        if handler_instance.is_user_message():
+            # Get the message details from the handler
+            sns_message = json.dumps(
+                {
+                    "app_token": app_token,
+                    "channel": handler_instance.get_channel_name(),
+                    **handler_instance.extract_message_fields(),
+                }
+            )
+            # Forward the message to the SNS topic
+            self.publish_to_sns(
+                topic_arn=_INCOMING_MSGS_SNS_TOPIC_ARN, message=sns_message
+            )
+        else:
+            # e.g., WhatsApp status updates: they are still acknowledged below,
+            # so the channel does not retry them, but there is nothing to forward
+            self.do_log("Not a user message, nothing to forward.")
         # Respond with 200 OK to acknowledge receipt of the message
         # It is necessary to return a response to the Channel webhook and avoid retries
         # v.g: https://core.telegram.org/bots/api#making-requests
@@ -102,11 +121,15 @@ class AllChannelsReceiver(BaseLambdaHandler):
         return {
             "statusCode": 200,
             "headers": {"Content-Type": "application/json"},
-            "body": json.dumps(
-                {"status": "ok"}
-            ),  # Respond to channel webhook with 200 OK
+            "body": _OK_RESPONSE_BODY,  # Respond to channel webhook with 200 OK
         }
 
+    def publish_to_sns(self, topic_arn: str, message: str):
+        """
+        Publishes the message to the SNS topic using the module-level client.
+        """
+        return _SNS_CLIENT.publish(TopicArn=topic_arn, Message=message)
+
 
 def handler(event, context):
     """
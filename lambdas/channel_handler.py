@@ -1,13 +1,30 @@
-from abc import abstractmethod
+from abc import ABC, abstractmethod
+from typing import ClassVar
 
 from app_common.base_lambda_handler import BaseLambdaHandler
+from text_utils import divide_msg_into_segments
 
 
-class ChannelHandler:
+class ChannelHandler(ABC):
     """
     Base class for channel handlers
     """
 
+    __slots__ = ("_lambda_handler",)
+
+    # The maximum number of characters per message for the channel.
+    # Must be set by the subclass
+    MAX_MESSAGE_LENGTH: ClassVar[int]
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Checks that the subclass sets MAX_MESSAGE_LENGTH, so a missing value
+        fails when the handler module is imported instead of on its first reply.
+        """
+        super().__init_subclass__(**kwargs)
+        if not isinstance(getattr(cls, "MAX_MESSAGE_LENGTH", None), int):
+            raise TypeError(f"{cls.__name__} must set MAX_MESSAGE_LENGTH to an int")
+
     def __init__(self, lambda_handler: BaseLambdaHandler) -> None:
         """
         The constructor receives the channel message object.
@@ -31,10 +48,14 @@ class ChannelHandler:
         # the ellipsis character (…) twice per segment as we do the division.
         # ATTENTION: If the ellipsis goes in the start of the segment, it needs
         # an additional space!
-        msg_segments = self.__divide_msg_into_segments(
-            full_reply_plain_text_msg, self._get_max_message_length() - 3, "… ", "…"
+        msg_segments = divide_msg_into_segments(
+            full_reply_plain_text_msg, self.MAX_MESSAGE_LENGTH - 3, "… ", "…"
         )
 
+        # The segments must be sent one at a time, in order: channels show the
+        # messages in the order they receive them. Handlers should send them over
+        # a pooled keep-alive session, so only the first segment pays for the
+        # connection setup.
         for msg_segment in msg_segments:
             self._do_reply_with_plain_text(msg_segment)
 
@@ -61,78 +82,6 @@ class ChannelHandler:
             error_msg,
         )
 
-    @staticmethod
-    def __divide_msg_into_segments(
-        full_msg, max_segment_size=4096, segment_prefix="", segment_suffix=""
-    ):
-        """
-        This method divides the message into segments.
-        """
-        if segment_prefix is None:
-            segment_prefix = ""
-
-        if segment_suffix is None:
-            segment_suffix = ""
-
-        step = max_segment_size - len(segment_prefix) - len(segment_suffix)
-
-        if full_msg is None:
-            full_msg = ""
-
-        full_msg_len = len(full_msg)
-        cur_start_pos = 0
-        result = []
-
-        while True:
-            msg_segment = full_msg[cur_start_pos : cur_start_pos + step].lstrip()
-            next_start_pos = cur_start_pos + step
-            last_pos = cur_start_pos + step - 1
-
-            # Do we need to make adjustments to the segment?
-            if last_pos + 1 < full_msg_len:
-                if full_msg[last_pos] == " ":
-                    # The segment ends with a blank space
-                    msg_segment = msg_segment.rstrip()
-                    msg_segment_len = len(msg_segment)
-
-                    if (
-                        msg_segment_len > 0
-                        and not msg_segment[msg_segment_len - 1].isalpha()
-                    ):
-                        msg_segment += " "
-                elif full_msg[last_pos + 1] != " ":
-                    # The segment ends with a piece of a word and the rest of
-                    # the word is in the next segment. We try to make things
-                    # prettier by backtracking in the segment looking for spaces
-                    # and making the segment a bit shorter than before
-                    while last_pos > cur_start_pos:
-                        if full_msg[last_pos] == " ":
-                            next_start_pos = last_pos
-                            msg_segment = full_msg[cur_start_pos:last_pos].lstrip()
-                            break
-
-                        last_pos = last_pos - 1
-
-            if cur_start_pos > 0:
-                # We're continuing from a previous segment
-                msg_segment = segment_prefix + msg_segment
-
-            is_last_segment = True
-
-            if cur_start_pos + step < full_msg_len:
-                # Some extra content still follows, we're not done yet
-                msg_segment += segment_suffix
-                is_last_segment = False
-
-            cur_start_pos = next_start_pos
-
-            result.append(msg_segment)
-
-            if is_last_segment:
-                break
-
-        return result
-
     def _extract_bot_token(self):
         """
         Extracts the Channel Bot Token from the self.body["channels_tokens"].
@@ -162,13 +111,6 @@ class ChannelHandler:
         """
         # must be implemented by the subclass
 
-    @abstractmethod
-    def _get_max_message_length(self) -> int:
-        """
-        This method must return the maximum number of characters per message for that channel.
-        """
-        # must be implemented by the subclass
-
     @abstractmethod
     def _do_reply_with_plain_text(self, full_msg):
         """
@@ -234,6 +176,29 @@ class ChannelHandler:
         """
         # must be implemented by the subclass
 
+    def is_user_message(self) -> bool:
+        """
+        Returns ``True`` if the incoming request carries a message sent by a user,
+        and ``False`` for other notifications from the channel (e.g., delivery
+        status updates), which are not forwarded. By default, every request is
+        considered a user message.
+        """
+        return True
+
+    def extract_message_fields(self) -> dict:
+        """
+        Returns all the fields of the incoming message that are forwarded to the
+        incoming messages topic, as returned by the extractors.
+        """
+        return {
+            "user_message": self.extract_user_txt_msg(),
+            "channel_user_firstname": self.extract_channel_user_firstname(),
+            "channel_user_id": self.extract_channel_user_id(),
+            "channel_chat_id": self.extract_channel_chat_id(),
+            "channel_msg_id": self.extract_channel_msg_id(),
+            "user_message_timestamp": self.extract_message_timestamp(),
+        }
+
     def extract_channel_webhook_validation_code(self):
         """
         If necessary, this method must return the webhook validation code.
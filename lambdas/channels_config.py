@@ -2,13 +2,33 @@
 This module contains the configuration for the channels supported.
 """
 
-from telegram_handler import TelegramHandler
-from whatsapp_handler import WhatsAppHandler
+import importlib
 
-# Mapping of channel names to their respective handler classes
+# Mapping of channel names to the "module.ClassName" path of their handler classes.
+# The handler modules are imported only when the channel is first used, so a cold
+# start does not pay for loading the code of every supported channel.
 CHANNELS_HANDLER_CLASS_MAP = {
-    "telegram": TelegramHandler,
-    "whatsapp": WhatsAppHandler, 
-    "messenger": "MessengerHandler", #TODO: #10 Implement the MessengerHandler class
+    "telegram": "telegram_handler.TelegramHandler",
+    "whatsapp": "whatsapp_handler.WhatsAppHandler",
+    "messenger": None,  # TODO: #10 Implement the MessengerHandler class
     # Add more handlers here as needed
 }
+
+# Handler classes already imported, by channel name
+_loaded_handler_classes = {}
+
+
+def get_channel_handler_class(channel_name):
+    """
+    Returns the handler class for the given channel, importing its module on
+    first use. Returns None if the channel is not supported.
+    """
+    handler_class = _loaded_handler_classes.get(channel_name)
+    if handler_class is None:
+        handler_class_path = CHANNELS_HANDLER_CLASS_MAP.get(channel_name)
+        if not handler_class_path:
+            return None
+        module_name, class_name = handler_class_path.rsplit(".", 1)
+        handler_class = getattr(importlib.import_module(module_name), class_name)
+        _loaded_handler_classes[channel_name] = handler_class
+    return handler_class
@@ -0,0 +1,33 @@
+"""
+This module contains the HTTP clients shared by the channel handlers.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_session = None
+
+
+def get_session() -> requests.Session:
+    """
+    Returns the requests session shared by all the channel handlers, creating it
+    on first use. It lives as long as the execution environment, so consecutive
+    messages and warm invocations reuse its keep-alive connections to the channel
+    APIs instead of opening a new TCP/TLS connection per request.
+    Only failures to connect (when nothing was sent yet) are retried: POST is not
+    in Retry's default allowed_methods, so a reply that reached the server is
+    never sent twice.
+    """
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        _session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=20,
+                max_retries=Retry(total=2, backoff_factor=0.1),
+            ),
+        )
+    return _session
@@ -2,17 +2,15 @@
 This module is the Lambda handler to process outgoing messages.
 """
 
-import os
-import sys
 import json
 
-# Adds lambda/create/packages to the system path.
+# Adds lambdas/packages to the system path.
 # This must be done before importing any modules from the packages directory.
-sys.path.append(os.path.join(os.path.dirname(__file__), "packages"))
+import _bootstrap  # noqa: F401
 
 from app_common.base_lambda_handler import BaseLambdaHandler
 from app_common.app_utils import do_log
-from channels_config import CHANNELS_HANDLER_CLASS_MAP as HANDLERS_MAP
+from channels_config import get_channel_handler_class
 from channel_handler import ChannelHandler
 
 
@@ -28,7 +26,7 @@ class MessageSender(BaseLambdaHandler):
         # Getting the channel name from the body
         channel_name = self.body["channel"]
         # Getting the handler class instance for the channel
-        channel_handler: ChannelHandler = HANDLERS_MAP.get(channel_name)(self)
+        channel_handler: ChannelHandler = get_channel_handler_class(channel_name)(self)
         # send the message
         channel_server_response = channel_handler.send_plain_text_reply(
             self.body["bot_message"]
@@ -3,8 +3,8 @@ This module contains the Lambda handler class to process incoming Telegram messa
 """
 
 from channel_handler import ChannelHandler
-import requests
 from app_common.base_lambda_handler import BaseLambdaHandler
+from http_clients import get_session
 
 
 class TelegramHandler(ChannelHandler):
@@ -12,11 +12,23 @@ class TelegramHandler(ChannelHandler):
     The Lambda handler class to process incoming Telegram messages.
     """
 
+    __slots__ = ("_bot_token", "_send_message_url", "_message")
+
+    # The maximum message length supported by Telegram
+    MAX_MESSAGE_LENGTH = 4096
+
     def __init__(self, lambda_handler: BaseLambdaHandler) -> None:
         super().__init__(lambda_handler)
-        # Telegram Bot Token from environment variable
+        # Telegram Bot Token from the message body
         self._bot_token = self._extract_bot_token()
-        self._telegram_server_url = f"https://api.telegram.org/bot{self._bot_token}/"
+        # The token comes with each message, so the endpoint is built per handler,
+        # but only once instead of on every segment sent
+        self._send_message_url = (
+            f"https://api.telegram.org/bot{self._bot_token}/sendMessage"
+        )
+        # The incoming Telegram message, looked up once for all the extractors.
+        # Messages sent back by the chatbot have no "message" dictionary
+        self._message = self._lambda_handler.body.get("message", {})
 
     def get_channel_name(self) -> str:
         return "telegram"
@@ -24,30 +36,19 @@ class TelegramHandler(ChannelHandler):
     def _do_reply_with_plain_text(self, full_msg):
         """
         Leverages the Telegram API to send a text-only message to the Telegram
-        chat currently being serviced by this lambda function, and returns the
-        response provided by Telegram after converting it to JSON format.
+        chat currently being serviced by this lambda function. Raises an
+        ``HTTPError`` if Telegram rejects the message. The response body is not
+        parsed, since nobody reads it.
         """
         data = {
             "chat_id": self.extract_channel_chat_id(),
             "text": full_msg,
             "parse_mode": "HTML",
         }
-        response = requests.post(
-            self._telegram_server_url + "sendMessage", data=data, timeout=10
-        )
+        response = get_session().post(self._send_message_url, data=data, timeout=10)
 
         response.raise_for_status()
 
-        response_json = response.json()
-
-        return response_json
-
-    def _get_max_message_length(self) -> int:
-        """
-        Returns the maximum message length supported by Telegram.
-        """
-        return 4096
-
     def extract_user_txt_msg(self) -> str:
         """
         Returns the text of a message (most likely the latest message) in the
@@ -56,11 +57,7 @@ class TelegramHandler(ChannelHandler):
         dictionary with data from a Telegram message, see the file
         ``docs/telegram/typical-lambda-function-parameters.txt``.
         """
-        body = self._lambda_handler.body
-        if "message" in body and "text" in body["message"] and body["message"]["text"]:
-            return body["message"]["text"]
-        # else
-        return None
+        return self._message.get("text") or None
 
     def extract_channel_user_firstname(self):
         """
@@ -74,7 +71,7 @@ class TelegramHandler(ChannelHandler):
         # if self.get_callback_data():
         #     return self._incoming_user_msg_obj["callback_query"]["from"]["first_name"]
         # else
-        return self._lambda_handler.body["message"]["from"]["first_name"]
+        return self._message["from"]["first_name"]
 
     def extract_channel_user_id(self):
         """
@@ -89,7 +86,7 @@ class TelegramHandler(ChannelHandler):
         # if self.get_callback_data() is not None:
         #     return self._incoming_user_msg_obj["callback_query"]["from"]["id"]
         # else
-        return self._lambda_handler.body["message"]["from"]["id"]
+        return self._message["from"]["id"]
 
     def extract_channel_chat_id(self):
         """
@@ -108,7 +105,7 @@ class TelegramHandler(ChannelHandler):
             # chatbot message arrives after the processing
             return self._lambda_handler.body["channel_chat_id"]
         # else:
-        return self._lambda_handler.body["message"]["chat"]["id"]
+        return self._message["chat"]["id"]
 
     # returns the telegram update_id
     def extract_channel_msg_id(self):
@@ -124,7 +121,7 @@ class TelegramHandler(ChannelHandler):
         # if self.get_callback_data():
         #     return self._incoming_user_msg_obj["callback_query"]["message"]["message_id"]
         # else
-        return self._lambda_handler.body["message"]["message_id"]
+        return self._message["message_id"]
 
     def validate_user_as_human(self) -> bool:
         """
@@ -141,10 +138,10 @@ class TelegramHandler(ChannelHandler):
         # if self.get_callback_data():
         #     return self._incoming_user_msg_obj["callback_query"]["from"]["is_bot"]
         # else
-        return self._lambda_handler.body["message"]["from"]["is_bot"]
+        return self._message["from"]["is_bot"]
 
     def extract_message_timestamp(self) -> int:
         """
         Extracts the timestamp of the Telegram message.
         """
-        return self._lambda_handler.body["message"]["date"]
+        return self._message["date"]
@@ -0,0 +1,82 @@
+"""
+This module contains text manipulation utilities shared by the channel handlers.
+It has no dependencies, so it can be compiled (e.g., with mypyc) if needed.
+"""
+
+
+def divide_msg_into_segments(
+    full_msg: str | None,
+    max_segment_size: int = 4096,
+    segment_prefix: str | None = "",
+    segment_suffix: str | None = "",
+) -> list[str]:
+    """
+    Divides the message into segments of at most max_segment_size characters,
+    breaking them at blank spaces whenever possible. Every segment but the
+    first starts with segment_prefix, and every segment but the last ends
+    with segment_suffix. None is accepted for the message, the prefix and the
+    suffix, and is treated as an empty string.
+    """
+    if segment_prefix is None:
+        segment_prefix = ""
+
+    if segment_suffix is None:
+        segment_suffix = ""
+
+    step = max_segment_size - len(segment_prefix) - len(segment_suffix)
+
+    if full_msg is None:
+        full_msg = ""
+
+    full_msg_len = len(full_msg)
+
+    if full_msg_len <= step:
+        # Most messages fit in a single segment; skip the loop entirely
+        return [full_msg.lstrip()]
+
+    cur_start_pos = 0
+    result = []
+
+    while True:
+        segment_end = next_start_pos = cur_start_pos + step
+        ends_with_blank_space = False
+
+        # Do we need to make adjustments to the segment?
+        if segment_end < full_msg_len:
+            if full_msg[segment_end - 1] == " ":
+                # The segment ends with a blank space
+                ends_with_blank_space = True
+            elif full_msg[segment_end] != " ":
+                # The segment ends with a piece of a word and the rest of
+                # the word is in the next segment. We try to make things
+                # prettier by ending the segment at its last blank space
+                # (if any), making the segment a bit shorter than before
+                last_space_pos = full_msg.rfind(" ", cur_start_pos + 1, segment_end)
+                if last_space_pos != -1:
+                    segment_end = next_start_pos = last_space_pos
+
+        # The segment is sliced only once, after its end is known
+        msg_segment = full_msg[cur_start_pos:segment_end].lstrip()
+
+        if ends_with_blank_space:
+            msg_segment = msg_segment.rstrip()
+
+            if msg_segment and not msg_segment[-1].isalpha():
+                msg_segment += " "
+
+        # Are we continuing from a previous segment?
+        prefix = segment_prefix if cur_start_pos > 0 else ""
+
+        # Does some extra content still follow? Then we're not done yet
+        is_last_segment = cur_start_pos + step >= full_msg_len
+        suffix = "" if is_last_segment else segment_suffix
+
+        cur_start_pos = next_start_pos
+
+        # Build the final segment with a single concatenation
+        result.append(f"{prefix}{msg_segment}{suffix}")
+
+        if is_last_segment:
+            break
+
+    return result
@@ -4,9 +4,17 @@ See:
 https://developers.facebook.com/docs/whatsapp/api/messages/text/
 """
 
+from collections import namedtuple
+
 from channel_handler import ChannelHandler
-import requests
 from app_common.base_lambda_handler import BaseLambdaHandler
+from http_clients import get_session
+
+# The fields of an incoming WhatsApp message, as extracted by _parse_body()
+_WhatsAppMessageFields = namedtuple(
+    "_WhatsAppMessageFields", ["text", "name", "wa_id", "msg_id", "timestamp"]
+)
+_NO_MESSAGE_FIELDS = _WhatsAppMessageFields(None, None, None, None, None)
 
 
 class WhatsAppHandler(ChannelHandler):
@@ -14,13 +22,22 @@ class WhatsAppHandler(ChannelHandler):
     The Lambda handler class to process incoming WhatsApp messages.
     """
 
+    __slots__ = (
+        "_access_token",
+        "_phone_number_id",
+        "_whatsapp_api_url",
+        "_headers",
+        "_parsed_body",
+    )
+
+    # The maximum message length supported by WhatsApp
+    MAX_MESSAGE_LENGTH = 4096
+
     def __init__(self, lambda_handler: BaseLambdaHandler) -> None:
         super().__init__(lambda_handler)
-        self._access_token = None
-        self._phone_number_id = None
-        self._whatsapp_api_url = None
-        token_info = self._extract_bot_token()
-        if token_info:
+        # Filled in by _parse_body() on first use
+        self._parsed_body = None
+        if token_info := self._extract_bot_token():
             # the expected structure for WhatsApp token_info is:
             # {
             #     "access_token": "access token",
@@ -29,11 +46,21 @@ class WhatsAppHandler(ChannelHandler):
             # observe that "access token" and "phone number id" will be available
             # only after the message be processed by other components.
             # So, it's necessary keep the access using ".get" method.
-            self._access_token = token_info.get("access_token")
-            self._phone_number_id = token_info.get("phone_number_id")
+            self._access_token = access_token = token_info.get("access_token")
+            self._phone_number_id = phone_number_id = token_info.get("phone_number_id")
             self._whatsapp_api_url = (
-                f"https://graph.facebook.com/v21.0/{self._phone_number_id}/messages"
+                f"https://graph.facebook.com/v21.0/{phone_number_id}/messages"
             )
+            # Built once and shared by every segment sent by this handler
+            self._headers = {
+                "Authorization": f"Bearer {access_token}",
+                "Content-Type": "application/json",
+            }
+        else:
+            self._access_token = None
+            self._phone_number_id = None
+            self._whatsapp_api_url = None
+            self._headers = None
 
     def get_channel_name(self) -> str:
         return "whatsapp"
@@ -41,8 +68,9 @@ class WhatsAppHandler(ChannelHandler):
     def _do_reply_with_plain_text(self, full_msg):
         """
         Leverages the WhatsApp API to send a text-only message to the WhatsApp
-        user currently being serviced by this lambda function, and returns the
-        response provided by WhatsApp after converting it to JSON format.
+        user currently being serviced by this lambda function. Raises an
+        ``HTTPError`` if WhatsApp rejects the message. The response body is not
+        parsed, since nobody reads it.
         """
         data = {
             "messaging_product": "whatsapp",
@@ -50,69 +78,97 @@ class WhatsAppHandler(ChannelHandler):
             "type": "text",
             "text": {"body": full_msg},
         }
-        headers = {
-            "Authorization": f"Bearer {self._access_token}",
-            "Content-Type": "application/json",
-        }
-        response = requests.post(
-            self._whatsapp_api_url, json=data, headers=headers, timeout=10
+        response = get_session().post(
+            self._whatsapp_api_url, json=data, headers=self._headers, timeout=10
         )
         response.raise_for_status()
-        response_json = response.json()
-        return response_json
 
-    def _get_max_message_length(self) -> int:
+    def _parse_body(self) -> _WhatsAppMessageFields:
+        """
+        Returns the fields of the incoming WhatsApp message. The body is walked
+        only once, on the first call, instead of once per extractor. A field
+        missing from the body is returned as None.
+        """
+        if self._parsed_body is None:
+            self._parsed_body = self.__parse_body(self._lambda_handler.body)
+        return self._parsed_body
+
+    @staticmethod
+    def __parse_body(body) -> _WhatsAppMessageFields:
+        """
+        Extracts the message fields from the ``entry[0].changes[0].value``
+        dictionary of the body.
+        """
+        try:
+            value = body["entry"][0]["changes"][0]["value"]
+        except (IndexError, KeyError, TypeError):
+            # Not an incoming message, e.g., a chatbot reply on its way out
+            return _NO_MESSAGE_FIELDS
+
+        text = name = wa_id = msg_id = timestamp = None
+        # Anything that is not shaped as expected (including nulls) yields None
+        try:
+            contact = value["contacts"][0]
+        except (IndexError, KeyError, TypeError):
+            contact = None
+        if isinstance(contact, dict):
+            wa_id = contact.get("wa_id")
+            try:
+                name = contact["profile"]["name"]
+            except (KeyError, TypeError):
+                pass
+
+        try:
+            message = value["messages"][0]
+        except (IndexError, KeyError, TypeError):
+            message = None
+        if isinstance(message, dict):
+            msg_id = message.get("id")
+            message_text = message.get("text")
+            if isinstance(message_text, dict) and message.get("type") == "text":
+                text = message_text.get("body")
+            try:
+                timestamp = int(message["timestamp"])
+            except (KeyError, TypeError, ValueError):
+                pass
+
+        return _WhatsAppMessageFields(text, name, wa_id, msg_id, timestamp)
+
+    def is_user_message(self) -> bool:
         """
-        Returns the maximum message length supported by WhatsApp.
+        Returns ``True`` if the body is an incoming WhatsApp message. Status
+        notifications (sent, delivered, read) carry ``statuses`` instead of
+        ``contacts`` and ``messages``, so they have no user ID.
         """
-        return 4096
+        return self._parse_body().wa_id is not None
 
     def extract_user_txt_msg(self) -> str:
         """
         Returns the text of a message (most likely the latest message) in the
         WhatsApp conversation currently being serviced by this lambda function.
         """
-        body = self._lambda_handler.body
-        if "entry" in body:
-            try:
-                message = body["entry"][0]["changes"][0]["value"]["messages"][0]
-                if message["type"] == "text" and "text" in message:
-                    return message["text"]["body"]
-            except (IndexError, KeyError):
-                return None
-        return None
+        return self._parse_body().text
 
     def extract_channel_user_firstname(self):
         """
         Returns the name of the user that is participating in the
         WhatsApp conversation currently being serviced by this lambda function.
         """
-        body = self._lambda_handler.body
-        if "entry" in body:
-            try:
-                name = body["entry"][0]["changes"][0]["value"]["contacts"][0][
-                    "profile"
-                ]["name"]
-                return name
-            except (IndexError, KeyError):
-                return None
-        return None
+        return self._parse_body().name
 
     def extract_channel_user_id(self):
         """
         Returns the ID (phone number) of the user that is participating in the
         WhatsApp conversation currently being serviced by this lambda function.
         """
-        body = self._lambda_handler.body
-
-        if "channel_user_id" in body:
+        channel_user_id = self._lambda_handler.body.get("channel_user_id")
+        if channel_user_id is not None:
             # This is the structure of the body when the
             # chatbot message arrives after the processing
-            return body["channel_user_id"]
+            return channel_user_id
         # else:
         # This is the structure of the body when the message arrives to be processed
-        user_id = body["entry"][0]["changes"][0]["value"]["contacts"][0]["wa_id"]
-        return user_id
+        return self._parse_body().wa_id
 
     def extract_channel_chat_id(self):
         """
@@ -126,16 +182,7 @@ class WhatsAppHandler(ChannelHandler):
         Returns the ID of a message (most likely the latest message) in the
         WhatsApp conversation currently being serviced by this lambda function.
         """
-        body = self._lambda_handler.body
-        if "entry" in body:
-            try:
-                message_id = body["entry"][0]["changes"][0]["value"]["messages"][0][
-                    "id"
-                ]
-                return message_id
-            except (IndexError, KeyError):
-                return None
-        return None
+        return self._parse_body().msg_id
 
     def validate_user_as_human(self) -> bool:
         """
@@ -150,16 +197,7 @@ class WhatsAppHandler(ChannelHandler):
         """
         Extracts the timestamp of the WhatsApp message.
         """
-        body = self._lambda_handler.body
-        if "entry" in body:
-            try:
-                timestamp_str = body["entry"][0]["changes"][0]["value"]["messages"][0][
-                    "timestamp"
-                ]
-                return int(timestamp_str)
-            except (IndexError, KeyError, ValueError):
-                return None
-        return None
+        return self._parse_body().timestamp
 
     def extract_channel_webhook_validation_code(self):
         """
@@ -167,7 +205,8 @@ class WhatsAppHandler(ChannelHandler):
         simply returning the challenge code provided in the query parameters
         without validating the token.
         """
-        query_params = self._lambda_handler.event.get("queryStringParameters", {})
+        # API Gateway sends None, not an empty dict, when there is no query string
+        query_params = self._lambda_handler.event.get("queryStringParameters") or {}
         challenge = query_params.get("hub.challenge")
 
         # Return the challenge to validate the webhook
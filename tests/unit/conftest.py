@@ -0,0 +1,56 @@
+import os
+import sys
+import types
+
+# The Lambda functions import their modules by name from the lambdas directory,
+# so make them importable the same way in the unit tests
+_LAMBDAS_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "lambdas")
+)
+
+if _LAMBDAS_DIR not in sys.path:
+    sys.path.insert(0, _LAMBDAS_DIR)
+
+# Adds lambdas/packages to the system path, as the Lambda entry points do
+import _bootstrap  # noqa: E402,F401
+
+
+def _stub_module(name, **attributes):
+    module = types.ModuleType(name)
+    module.__dict__.update(attributes)
+    sys.modules[name] = module
+
+
+# app_common comes from the aws-common repo and is only installed in
+# lambdas/packages by the setup step. The code under test only subclasses
+# BaseLambdaHandler and uses it in annotations, so a bare stand-in is enough
+try:
+    import app_common.base_lambda_handler  # noqa: F401
+except ImportError:
+
+    class BaseLambdaHandler:
+        """
+        Stand-in for app_common.base_lambda_handler.BaseLambdaHandler.
+        """
+
+    _stub_module("app_common")
+    _stub_module("app_common.base_lambda_handler", BaseLambdaHandler=BaseLambdaHandler)
+
+# boto3 is provided by the Lambda runtime, not by the project requirements.
+# The receiver only creates its SNS client at import time, and the tests replace
+# the publish itself
+try:
+    import boto3  # noqa: F401
+except ImportError:
+
+    class Config:
+        """
+        Stand-in for botocore.config.Config.
+        """
+
+        def __init__(self, **kwargs):
+            pass
+
+    _stub_module("boto3", client=lambda *args, **kwargs: None)
+    _stub_module("botocore")
+    _stub_module("botocore.config", Config=Config)
@@ -0,0 +1,48 @@
+import os
+import json
+from types import SimpleNamespace
+
+# Read by the receiver module at import time
+os.environ.setdefault("INCOMING_MSGS_SNS_TOPIC_ARN", "arn:aws:sns:us-east-1:0:test")
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+from all_channels_receiver import AllChannelsReceiver  # noqa: E402
+
+
+class _Receiver(AllChannelsReceiver):
+    def __init__(self):
+        self.published_messages = []
+
+    def do_log(self, *args, **kwargs):
+        pass
+
+    def publish_to_sns(self, topic_arn: str, message: str):
+        self.published_messages.append(json.loads(message))
+
+
+def _channel_handler(is_user_message):
+    return SimpleNamespace(
+        is_user_message=lambda: is_user_message,
+        get_channel_name=lambda: "whatsapp",
+        extract_message_fields=lambda: {"user_message": "hello"},
+    )
+
+
+def test_user_message_is_published():
+    receiver = _Receiver()
+
+    response = receiver._handle_post(_channel_handler(True), "app123")
+
+    assert response["statusCode"] == 200
+    assert receiver.published_messages == [
+        {"app_token": "app123", "channel": "whatsapp", "user_message": "hello"}
+    ]
+
+
+def test_non_user_message_is_acknowledged_but_not_published():
+    receiver = _Receiver()
+
+    response = receiver._handle_post(_channel_handler(False), "app123")
+
+    assert response["statusCode"] == 200
+    assert receiver.published_messages == []
@@ -1,5 +1,6 @@
 import aws_cdk as core
 import aws_cdk.assertions as assertions
+import pytest
 
 from channel_router.channel_router_stack import ChannelRouterStack
 
@@ -13,3 +14,47 @@ def test_sqs_queue_created():
 #     template.has_resource_properties("AWS::SQS::Queue", {
 #         "VisibilityTimeout": 300
 #     })
+
+
+@pytest.fixture(scope="module")
+def template():
+    """
+    The synthesized stack, shared by the tests of this module.
+    """
+    app = core.App()
+    stack = ChannelRouterStack(app, "channel-router")
+    return assertions.Template.from_stack(stack)
+
+
+def test_receiver_live_alias_has_provisioned_concurrency(template):
+    template.has_resource_properties(
+        "AWS::Lambda::Alias",
+        {
+            "Name": "live",
+            "ProvisionedConcurrencyConfig": {"ProvisionedConcurrentExecutions": 5},
+        },
+    )
+
+
+def test_webhook_http_api_routes_created(template):
+    template.has_resource_properties("AWS::ApiGatewayV2::Api", {"ProtocolType": "HTTP"})
+    template.has_resource_properties(
+        "AWS::ApiGatewayV2::Route", {"RouteKey": "POST /{proxy+}"}
+    )
+    template.has_resource_properties(
+        "AWS::ApiGatewayV2::Route", {"RouteKey": "GET /{proxy+}"}
+    )
+    template.has_resource_properties(
+        "AWS::ApiGatewayV2::Integration", {"PayloadFormatVersion": "1.0"}
+    )
+
+
+def test_lambdas_memory_size(template):
+    template.has_resource_properties(
+        "AWS::Lambda::Function",
+        {"Handler": "all_channels_receiver.handler", "MemorySize": 1769},
+    )
+    template.has_resource_properties(
+        "AWS::Lambda::Function",
+        {"Handler": "outgoing_messages_sender.handler", "MemorySize": 512},
+    )
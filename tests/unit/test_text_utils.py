@@ -0,0 +1,36 @@
+from text_utils import divide_msg_into_segments
+
+
+def test_short_message_is_a_single_segment():
+    assert divide_msg_into_segments("hello world", 20) == ["hello world"]
+
+
+def test_empty_message_is_a_single_empty_segment():
+    assert divide_msg_into_segments("", 10) == [""]
+    assert divide_msg_into_segments(None, 10) == [""]
+
+
+def test_segments_break_at_the_last_blank_space():
+    assert divide_msg_into_segments("hello world foo", 10) == ["hello", "world foo"]
+    assert divide_msg_into_segments("aaaa bbbb cccc", 5) == ["aaaa", "bbbb", "cccc"]
+
+
+def test_word_longer_than_a_segment_is_cut():
+    assert divide_msg_into_segments("abcdefghijklmnopqrstuvwxyz", 10) == [
+        "abcdefghij",
+        "klmnopqrst",
+        "uvwxyz",
+    ]
+
+
+def test_prefix_and_suffix_mark_the_continued_segments():
+    assert divide_msg_into_segments("one two three four five six", 12, "… ", "…") == [
+        "one two…",
+        "… three…",
+        "… four…",
+        "… five six",
+    ]
+
+
+def test_leading_blank_spaces_are_stripped():
+    assert divide_msg_into_segments("   leading spaces", 50) == ["leading spaces"]
@@ -0,0 +1,79 @@
+from types import SimpleNamespace
+
+from whatsapp_handler import WhatsAppHandler
+
+
+def _whatsapp_handler(value):
+    body = {"entry": [{"changes": [{"value": value}]}]}
+    return WhatsAppHandler(SimpleNamespace(body=body, event={}))
+
+
+def test_text_message_fields_extracted():
+    handler = _whatsapp_handler(
+        {
+            "contacts": [{"profile": {"name": "Ann"}, "wa_id": "5511999999999"}],
+            "messages": [
+                {
+                    "id": "wamid.1",
+                    "type": "text",
+                    "text": {"body": "hello"},
+                    "timestamp": "1700000000",
+                }
+            ],
+        }
+    )
+
+    assert handler.is_user_message()
+    assert handler.extract_message_fields() == {
+        "user_message": "hello",
+        "channel_user_firstname": "Ann",
+        "channel_user_id": "5511999999999",
+        "channel_chat_id": "5511999999999",
+        "channel_msg_id": "wamid.1",
+        "user_message_timestamp": 1700000000,
+    }
+
+
+def test_status_update_is_not_a_user_message():
+    handler = _whatsapp_handler(
+        {
+            "statuses": [
+                {
+                    "id": "wamid.1",
+                    "status": "delivered",
+                    "recipient_id": "5511999999999",
+                    "timestamp": "1700000000",
+                }
+            ],
+        }
+    )
+
+    assert not handler.is_user_message()
+
+
+def test_malformed_message_fields_are_none():
+    handler = _whatsapp_handler(
+        {
+            "contacts": [None],
+            "messages": [{"id": "wamid.1", "type": "text", "text": "hello"}],
+        }
+    )
+
+    assert not handler.is_user_message()
+    assert handler.extract_user_txt_msg() is None
+    assert handler.extract_channel_user_firstname() is None
+    assert handler.extract_channel_msg_id() == "wamid.1"
+
+    handler = _whatsapp_handler(
+        {"contacts": [{"wa_id": "5511999999999", "profile": None}], "messages": [None]}
+    )
+
+    assert handler.is_user_message()
+    assert handler.extract_message_fields() == {
+        "user_message": None,
+        "channel_user_firstname": None,
+        "channel_user_id": "5511999999999",
+        "channel_chat_id": "5511999999999",
+        "channel_msg_id": None,
+        "user_message_timestamp": None,
+    }